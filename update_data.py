@@ -12,8 +12,11 @@ statistics object.
 
 Because this script makes network requests to ESPN, you should run it on
 your local machine (not within the hosted GitHub Pages environment).  You
-will need Python 3.8+ and the ``requests`` library installed.  To install
-``requests`` simply run ``pip install requests``.
+will need Python 3.8+ with the ``requests``, ``requests-cache`` and
+``orjson`` libraries installed (``pip install requests requests-cache
+orjson``).  Responses are cached under ``.cache/`` so repeated runs avoid
+re-fetching data that has not expired.  Optionally install ``brotli`` to
+receive ESPN's responses with brotli compression instead of gzip.
 
 Usage:
 
@@ -26,15 +29,104 @@ Saturday on the calendar.  After execution, commit and push the updated
 
 import argparse
 import datetime as _dt
-import json
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List
 
-import requests
+import orjson
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Brotli compresses ESPN's JSON noticeably better than gzip, but only
+# advertise it when a decoder is actually importable — otherwise the
+# response body would arrive still compressed.
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
 
 # Conference group identifiers for the Power‑4 conferences
 P4_GROUPS = {1, 4, 5, 8}
 
+# The season-stat names the site actually renders (see the rows tables in
+# game.js and the aggregations in rankings.js).  Everything else in the
+# boxscore is dropped before parsing, which keeps games.json lean and the
+# per-team dicts small.
+ALLOWED_STATS = frozenset(
+    {
+        "totalPointsPerGame",
+        "yardsPerGame",
+        "passingYardsPerGame",
+        "rushingYardsPerGame",
+        "totalPointsPerGameAllowed",
+        "yardsPerGameAllowed",
+        "passingYardsPerGameAllowed",
+        "rushingYardsPerGameAllowed",
+    }
+)
+
+# Matches plain numeric displayValues ("312", "45.3", "-2.5").  Ratio-style
+# values like "3-5" or "28:42" are skipped without paying for a raised
+# ValueError, which is the common case for roughly a third of stat rows.
+_NUMERIC = re.compile(r"-?\d+(?:\.\d+)?$").match
+
+# Number of concurrent ESPN requests during the per-event fan‑out.  The
+# workload is pure I/O waiting, so threads amortize latency over the
+# session's connection pool.
+MAX_WORKERS = 16
+
+# A single shared session so every ESPN request reuses the same TCP/TLS
+# connections instead of paying a fresh handshake per call.  Transient
+# server errors and rate limits are retried with a small backoff.
+# Responses are also cached on disk (SQLite) so repeat runs skip ESPN
+# entirely for data that rarely changes: team metadata is good for a
+# week, while scoreboard/summary payloads stay fresh for only minutes.
+# cache_control makes expired entries revalidate with If-None-Match /
+# If-Modified-Since, so an unchanged scoreboard costs a 304 instead of a
+# full re-download.
+_SESSION = requests_cache.CachedSession(
+    ".cache/espn",
+    backend="sqlite",
+    expire_after=_dt.timedelta(days=7),
+    allowable_methods=["GET"],
+    stale_if_error=True,
+    cache_control=True,
+    urls_expire_after={
+        "*/teams/*": _dt.timedelta(days=7),
+        "*/summary*": _dt.timedelta(minutes=10),
+        "*/scoreboard*": _dt.timedelta(minutes=5),
+    },
+)
+# Cap each host's pool at the fan-out width and block rather than open
+# throwaway sockets beyond it, so the whole run is served by at most
+# MAX_WORKERS warm TLS connections per host.
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_WORKERS,
+        pool_block=True,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+_SESSION.headers.update(
+    {
+        "Accept-Encoding": _ACCEPT_ENCODING,
+        "User-Agent": "p4-updater/1.0",
+        "Connection": "keep-alive",
+    }
+)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Update the games JSON dataset for the betting site.")
@@ -47,6 +139,10 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _scoreboard_url(date_str: str) -> str:
+    return f"https://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard?dates={date_str}"
+
+
 def next_saturday(today: _dt.date) -> str:
     """Return the date of the next Saturday as a YYYYMMDD string."""
     days_ahead = (5 - today.weekday()) % 7  # Saturday is weekday 5 (0=Mon)
@@ -58,14 +154,48 @@ def next_saturday(today: _dt.date) -> str:
 
 def fetch_json(url: str) -> Dict[str, Any]:
     """Helper to fetch JSON from a URL and raise for bad status codes."""
-    resp = requests.get(url)
+    resp = _SESSION.get(url, timeout=(3.05, 15))
     resp.raise_for_status()
-    return resp.json()
+    # orjson parses the raw bytes directly, skipping requests' str decode
+    return orjson.loads(resp.content)
+
+
+def _scoreboard_group_id(team_obj: Dict[str, Any]) -> Any:
+    """Return the conference group ID from a scoreboard ``team`` object.
+
+    Returns ``None`` when the ``conferenceId`` field is absent or not an
+    integer, in which case the caller needs the core-API fallback.
+    """
+    if team_obj.get("conferenceId") is None:
+        return None
+    try:
+        return int(team_obj.get("conferenceId"))
+    except (TypeError, ValueError):
+        return None
+
 
+def _scoreboard_logo(team_obj: Dict[str, Any]) -> Any:
+    """Pull a logo URL out of a scoreboard ``team`` object, if present.
+
+    Scoreboard payloads carry the logo either as a bare ``logo`` string or
+    as a ``logos`` list of link objects, depending on the endpoint version.
+    """
+    logo = team_obj.get("logo")
+    if logo:
+        return logo
+    logos = team_obj.get("logos") or []
+    if logos:
+        return logos[0].get("href")
+    return None
 
+
+@lru_cache(maxsize=512)
 def get_team_info(team_id: str) -> Dict[str, Any]:
     """
-    Retrieve basic team information for a given ESPN team ID.
+    Retrieve basic team information for a given ESPN team ID.  Results are
+    memoized per process (the same team recurs across dates and callers),
+    so duplicate lookups cost a dict hit rather than an HTTP round trip.
+    Callers must treat the returned dict as read-only.
 
     **Note:** ESPN's core API is not always accessible from every environment.
     This helper attempts to fetch team data via the core API, but if the
@@ -108,97 +238,157 @@ def get_event_stats(event_id: str) -> Dict[str, Any]:
         stats_map[team_id] = {}
         for stat in t.get("statistics", []):
             name = stat.get("name")
-            try:
-                value = float(stat.get("displayValue"))
-            except (TypeError, ValueError):
+            if name not in ALLOWED_STATS:
+                continue
+            value = stat.get("displayValue")
+            if value is None or not _NUMERIC(value):
                 continue
-            stats_map[team_id][name] = value
+            # Interning collapses the parsed key strings, which repeat for
+            # every team of every event, down to one object apiece.
+            stats_map[team_id][sys.intern(name)] = float(value)
     return stats_map
 
 
+def _project_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Trim a scoreboard event down to the handful of fields this script uses.
+
+    Scoreboard events carry a lot of baggage (leaders, headlines, in-game
+    situation, tickets, …) that we never read.  Projecting each event as it
+    is parsed lets the full payload be freed immediately instead of staying
+    alive for the whole build.
+    """
+    comp = event["competitions"][0]
+    odds_obj = (comp.get("odds") or [{}])[0]
+    broadcasts = comp.get("broadcasts") or []
+    return {
+        "id": event["id"],
+        "date": comp.get("date"),
+        "network": broadcasts[0].get("media", {}).get("shortName", "") if broadcasts else "",
+        "odds": {
+            "details": odds_obj.get("details"),
+            "overUnder": odds_obj.get("overUnder"),
+            "spread": odds_obj.get("spread"),
+            "favorite": odds_obj.get("team").get("id") if odds_obj.get("team") else None,
+        },
+        "competitors": [
+            {"team": c.get("team") or {}, "homeAway": c.get("homeAway")}
+            for c in comp.get("competitors") or []
+        ],
+    }
+
+
 def build_games_for_date(date_str: str) -> List[Dict[str, Any]]:
     """Fetch and build event objects for the specified date."""
     games: List[Dict[str, Any]] = []
-    scoreboard_url = (
-        f"https://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard?dates={date_str}"
-    )
-    scoreboard = fetch_json(scoreboard_url)
-    events = scoreboard.get("events") or []
-    for event in events:
-        competitions = event.get("competitions") or []
-        if not competitions:
-            continue
-        comp = competitions[0]
-        competitors = comp.get("competitors") or []
-        # Determine if at least one competitor belongs to a Power‑4 conference
-        p4 = False
-        competitor_entries: List[Dict[str, Any]] = []
-        for c in competitors:
-            team_obj = c.get("team") or {}
-            team_id = str(team_obj.get("id"))
-            # Use the conferenceId embedded in the scoreboard team object to
-            # determine Power‑4 membership.  If conferenceId is missing or
-            # unrecognized, fall back to get_team_info() to attempt to fetch
-            # additional details.
-            group_id = None
-            if team_obj.get("conferenceId") is not None:
-                try:
-                    group_id = int(team_obj.get("conferenceId"))
-                except (TypeError, ValueError):
-                    group_id = None
-            # Basic fields available directly from the scoreboard
-            name = team_obj.get("displayName") or team_obj.get("name") or ""
-            abbrev = team_obj.get("abbreviation") or team_obj.get("shortDisplayName") or ""
-            logo = team_obj.get("logo")  # may be None
-            # If group_id is still None, attempt to fetch via core API
-            if group_id is None:
-                info = get_team_info(team_id)
-                group_id = info.get("groupId")
-                name = info.get("name") or name
-                abbrev = info.get("abbreviation") or abbrev
-                logo = info.get("logo") or logo
-            competitor_entries.append(
+    scoreboard = fetch_json(_scoreboard_url(date_str))
+    events = [_project_event(e) for e in scoreboard.get("events") or [] if e.get("competitions")]
+    del scoreboard  # drop the full payload; only the projections are needed
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # Fan out the core-API lookups for any team whose scoreboard entry
+        # lacks a conferenceId or logo, and kick off summary fetches right
+        # away for events the scoreboard alone already proves are Power‑4,
+        # so both kinds of request overlap in flight.  Each call is pure
+        # I/O, so the pool keeps up to MAX_WORKERS requests going over the
+        # shared session instead of paying one round trip after another.
+        info_futures: Dict[str, Any] = {}
+        stats_futures: Dict[str, Any] = {}
+        for event in events:
+            for c in event["competitors"]:
+                team_obj = c["team"]
+                team_id = str(team_obj.get("id"))
+                if _scoreboard_group_id(team_obj) in P4_GROUPS:
+                    if event["id"] not in stats_futures:
+                        stats_futures[event["id"]] = executor.submit(get_event_stats, event["id"])
+                if team_id in info_futures:
+                    continue
+                if _scoreboard_group_id(team_obj) is None or _scoreboard_logo(team_obj) is None:
+                    info_futures[team_id] = executor.submit(get_team_info, team_id)
+        # Resolve competitor entries and apply the Power‑4 filter before any
+        # summary fetches, so non-P4 events never cost a summary request.
+        p4_events: List[Dict[str, Any]] = []
+        for event in events:
+            # Determine if at least one competitor belongs to a Power‑4 conference
+            p4 = False
+            competitor_entries: List[Dict[str, Any]] = []
+            for c in event["competitors"]:
+                team_obj = c["team"]
+                team_id = str(team_obj.get("id"))
+                # Use the conferenceId embedded in the scoreboard team object to
+                # determine Power‑4 membership.  If conferenceId is missing or
+                # unrecognized, fall back to get_team_info() to attempt to fetch
+                # additional details.
+                group_id = _scoreboard_group_id(team_obj)
+                # Basic fields available directly from the scoreboard
+                name = team_obj.get("displayName") or team_obj.get("name") or ""
+                abbrev = team_obj.get("abbreviation") or team_obj.get("shortDisplayName") or ""
+                logo = _scoreboard_logo(team_obj)  # may be None
+                # Fill in whatever the scoreboard lacked from the prefetched
+                # core-API lookup
+                if (group_id is None or logo is None) and team_id in info_futures:
+                    info = info_futures[team_id].result()
+                    if group_id is None:
+                        group_id = info.get("groupId")
+                    name = info.get("name") or name
+                    abbrev = info.get("abbreviation") or abbrev
+                    logo = logo or info.get("logo")
+                competitor_entries.append(
+                    {
+                        "id": team_id,
+                        "name": name,
+                        "abbreviation": abbrev,
+                        "groupId": group_id,
+                        "logo": logo,
+                        "homeAway": c["homeAway"],
+                    }
+                )
+                if group_id in P4_GROUPS:
+                    p4 = True
+            if not p4:
+                continue
+            p4_events.append({"event": event, "competitors": competitor_entries})
+        # Fan out summary fetches for any surviving events whose Power‑4
+        # status only became known after the team lookups resolved.
+        for entry in p4_events:
+            eid = entry["event"]["id"]
+            if eid not in stats_futures:
+                stats_futures[eid] = executor.submit(get_event_stats, eid)
+        for entry in p4_events:
+            event = entry["event"]
+            games.append(
                 {
-                    "id": team_id,
-                    "name": name,
-                    "abbreviation": abbrev,
-                    "groupId": group_id,
-                    "logo": logo,
-                    "homeAway": c.get("homeAway"),
+                    "id": event["id"],
+                    "date": event["date"],
+                    "network": event["network"],
+                    "odds": event["odds"],
+                    "competitors": entry["competitors"],
+                    "stats": stats_futures[event["id"]].result(),
                 }
             )
-            if group_id in P4_GROUPS:
-                p4 = True
-        if not p4:
-            continue
-        # Betting odds
-        odds_obj = (comp.get("odds") or [{}])[0]
-        odds = {
-            "details": odds_obj.get("details"),
-            "overUnder": odds_obj.get("overUnder"),
-            "spread": odds_obj.get("spread"),
-            "favorite": odds_obj.get("team").get("id") if odds_obj.get("team") else None,
-        }
-        # Broadcast network
-        broadcasts = comp.get("broadcasts") or []
-        network = ""
-        if broadcasts:
-            network = broadcasts[0].get("media", {}).get("shortName", "")
-        # Stats per team
-        stats_map = get_event_stats(event["id"])
-        games.append(
-            {
-                "id": event["id"],
-                "date": comp.get("date"),
-                "network": network,
-                "odds": odds,
-                "competitors": competitor_entries,
-                "stats": stats_map,
-            }
-        )
     return games
 
 
+def _warm_cache(date_str: str) -> None:
+    """
+    Prefetch the scoreboard and fallback team lookups for ``date_str`` so a
+    later run against that date starts from the local cache.  Runs on a
+    background thread after the main output is written; any failure is
+    silently ignored because warming is purely opportunistic.
+    """
+    try:
+        scoreboard = fetch_json(_scoreboard_url(date_str))
+        for event in scoreboard.get("events") or []:
+            competitions = event.get("competitions") or []
+            if not competitions:
+                continue
+            for c in competitions[0].get("competitors") or []:
+                team_obj = c.get("team") or {}
+                if _scoreboard_group_id(team_obj) is None or _scoreboard_logo(team_obj) is None:
+                    get_team_info(str(team_obj.get("id")))
+    except Exception:
+        pass
+
+
 def main() -> None:
     args = parse_args()
     if args.date:
@@ -208,9 +398,23 @@ def main() -> None:
     print(f"Fetching games for {date_str}…", file=sys.stderr)
     games = build_games_for_date(date_str)
     out_path = "data/games.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(games, f, ensure_ascii=False, indent=2)
+    with open(out_path, "wb") as f:
+        f.write(orjson.dumps(games, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     print(f"Wrote {len(games)} games to {out_path}", file=sys.stderr)
+    # Warm the cache for the following Saturday so the next scheduled run
+    # hits local SQLite instead of ESPN.  The daemon thread is given a
+    # bounded join so a slow ESPN never delays exit by more than 30s.
+    try:
+        run_date = _dt.datetime.strptime(date_str, "%Y%m%d").date()
+    except ValueError:
+        return
+    warmer = threading.Thread(
+        target=_warm_cache,
+        args=(next_saturday(run_date + _dt.timedelta(days=1)),),
+        daemon=True,
+    )
+    warmer.start()
+    warmer.join(timeout=30)
 
 
 if __name__ == "__main__":